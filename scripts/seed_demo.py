@@ -9,24 +9,48 @@ Populates the ParkHub Rust/Axum API with:
 
 Usage:
     python scripts/seed_demo.py [--base-url URL] [--admin-password PW] [--dry-run]
+                                [--lot-factor N] [--rate N]
 
 Prerequisites:
     - ParkHub server running (default: http://localhost:7878)
     - Admin account already initialised (default: admin / ParkHub2026!)
-    - Python 3.8+, no external dependencies
+    - Python 3.8+, no external dependencies (orjson is used if installed)
+
+User registration runs concurrently (USER_WORKERS in flight) and bookings
+are pipelined over PIPELINE_CONNS keep-alive connections, so wall-clock
+time no longer scales with one round trip per request.
+Per-item progress is logged to stderr; the summary goes to stdout.
 """
 
 import argparse
+import asyncio
+import itertools
 import json
+import logging
+import logging.handlers
 import math
+import multiprocessing
 import os
+import queue
 import random
+import select
 import sys
+import threading
+import time
 import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any, Optional
-from urllib import request, error
-from urllib.parse import urlencode
+from http import client as http_client
+from typing import Any, Callable, Optional
+from urllib.parse import urlencode, urlsplit
+
+try:
+    import orjson  # optional: C-level JSON encode/decode straight to/from bytes
+except ImportError:
+    orjson = None
+
+log = logging.getLogger(__name__)
 
 # ─── Configuration ────────────────────────────────────────────────────────────
 BASE_URL       = "http://localhost:7878"
@@ -34,6 +58,14 @@ ADMIN_USER     = "admin"
 ADMIN_PASSWORD = "demo"
 ADMIN_EMAIL    = "admin@parkhub.test"
 ADMIN_NAME     = "Administrator"
+USER_WORKERS   = 32   # registrations hash passwords server-side; keep this lower
+PIPELINE_CONNS = 8    # keep-alive connections for pipelined per-booking POSTs
+PIPELINE_DEPTH = 16   # requests in flight per pipelined connection
+API_RATE       = 90   # req/s; the server's global limiter allows 100/s (burst 200)
+MAX_ATTEMPTS   = 5    # sends per pipelined request before it counts as failed
+RETRY_BACKOFF  = 1.0  # seconds every sender pauses after a 429
+HTTP_TIMEOUT   = 30   # seconds to connect or to wait for a response
+PARALLEL_LOTS  = 10   # build lot payloads in a process pool above this many lots
 
 # ─── German parking lots ──────────────────────────────────────────────────────
 LOTS = [
@@ -74,6 +106,7 @@ LAST_NAMES = [
 ]
 PLATE_PREFIXES = ["M", "HH", "B", "K", "F", "S", "N", "DO", "E", "L",
                   "HD", "KA", "MA", "A", "R", "BO", "WUE", "OB", "WI"]
+PLATE_LETTERS  = "ABCDEFGHJKLMNPRSTUVWXYZ"
 CAR_DATA = [
     ("Volkswagen", ["Golf", "Passat", "Tiguan", "Polo"]),
     ("BMW",        ["3er", "5er", "X5", "1er", "X3"]),
@@ -84,42 +117,345 @@ CAR_DATA = [
     ("Skoda",      ["Octavia", "Superb", "Fabia", "Karoq"]),
     ("Toyota",     ["Corolla", "Yaris", "RAV4", "C-HR"]),
 ]
+CAR_MODELS = [(make, model) for make, models in CAR_DATA for model in models]
 COLORS = ["Schwarz", "Weiss", "Silber", "Grau", "Blau", "Rot", "Gruen", "Braun"]
 
+# ─── Booking patterns ─────────────────────────────────────────────────────────
+WEEKDAY_HOURS = [7, 7, 8, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17]  # commuter peak
+WEEKEND_HOURS = list(range(9, 16))
+START_MINUTES = [0, 15, 30, 45]
+DURATIONS     = [30, 60, 90, 120, 180, 240, 300, 360, 480]
+
 
 # ─── HTTP helpers ─────────────────────────────────────────────────────────────
 
+def _dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)  # accepts bytes directly
+
+
+class _Pacer:
+    """Spaces requests evenly so the seeder stays under the server's global
+    rate limit, which PARKHUB_DISABLE_RATE_LIMITS does not lift."""
+
+    def __init__(self, rate: float):
+        self._lock = threading.Lock()
+        self._next = 0.0
+        self.set_rate(rate)
+
+    def set_rate(self, rate: float) -> None:
+        self._interval = 1.0 / rate if rate > 0 else 0.0
+
+    def reserve(self) -> float:
+        """Claim the next send slot. Returns how many seconds to wait for it."""
+        with self._lock:
+            now  = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self._interval
+        return slot - now
+
+    def backoff(self, seconds: float) -> None:
+        """Hold every sender back for `seconds` (after a 429)."""
+        with self._lock:
+            self._next = max(self._next, time.monotonic() + seconds)
+
+
+_pacer = _Pacer(API_RATE)
+
+
+# One keep-alive connection per (thread, host): requests reuse the TCP (and
+# TLS) session instead of paying a handshake each time.
+_connections = threading.local()
+
+
+def _connection(scheme: str, netloc: str) -> http_client.HTTPConnection:
+    pool = getattr(_connections, "pool", None)
+    if pool is None:
+        pool = _connections.pool = {}
+    conn = pool.get((scheme, netloc))
+    if conn is None:
+        cls  = http_client.HTTPSConnection if scheme == "https" else http_client.HTTPConnection
+        conn = pool[(scheme, netloc)] = cls(netloc, timeout=HTTP_TIMEOUT)
+    return conn
+
+
+def _raise_http_error(method: str, path: str, status: int, raw: bytes) -> None:
+    body_text = raw.decode("utf-8", errors="replace")
+    raise RuntimeError(f"HTTP {status} on {method} {path}: {body_text}")
+
+
+def _drain(resp: http_client.HTTPResponse) -> None:
+    """Consume a response body without keeping it, so the connection can be reused.
+
+    Reads through a fixed per-thread scratch buffer instead of allocating a
+    bytes object the size of the body.
+    """
+    buf = getattr(_connections, "scratch", None)
+    if buf is None:
+        buf = _connections.scratch = memoryview(bytearray(16 * 1024))
+    while resp.readinto(buf):
+        pass
+
+
 class Client:
     def __init__(self, base_url: str, token: Optional[str] = None):
         self.base_url = base_url.rstrip("/")
         self.token = token
+        parts = urlsplit(self.base_url)
+        self._scheme, self._netloc, self._prefix = parts.scheme, parts.netloc, parts.path
+        self._headers = {"Content-Type": "application/json", "Accept": "application/json"}
+        if token:
+            self._headers["Authorization"] = f"Bearer {token}"
 
     def post(self, path: str, body: dict) -> dict:
         return self._request("POST", path, body)
 
+    def post_status(self, path: str, body: dict) -> int:
+        """POST and return only the status code, for calls whose result is unused."""
+        return self._request_status("POST", path, body)
+
     def get(self, path: str) -> dict:
         return self._request("GET", path)
 
     def _request(self, method: str, path: str, body: Optional[dict] = None) -> dict:
-        url  = self.base_url + path
-        data = json.dumps(body).encode("utf-8") if body else None
-        headers = {"Content-Type": "application/json", "Accept": "application/json"}
-        if self.token:
-            headers["Authorization"] = f"Bearer {self.token}"
-        req = request.Request(url, data=data, headers=headers, method=method)
+        return _loads(self._exchange(method, path, body, keep_body=True)[1])
+
+    def _request_status(self, method: str, path: str, body: Optional[dict] = None) -> int:
+        return self._exchange(method, path, body, keep_body=False)[0]
+
+    def _exchange(self, method: str, path: str, body: Optional[dict],
+                  keep_body: bool) -> tuple[int, bytes]:
+        """Send one request; returns (status, body). Unkept bodies are drained, not returned.
+
+        Transport failures surface as RuntimeError like HTTP errors do, and
+        leave the thread's connection closed so the next request reconnects.
+        """
+        data = _dumps(body) if body else None
+        time.sleep(_pacer.reserve())
+        conn = _connection(self._scheme, self._netloc)
+        if conn.sock is not None and select.select([conn.sock], [], [], 0)[0]:
+            conn.close()  # an idle keep-alive socket only turns readable once the server hung up
         try:
-            with request.urlopen(req, timeout=30) as resp:
-                return json.loads(resp.read().decode("utf-8"))
-        except error.HTTPError as e:
-            body_text = e.read().decode("utf-8", errors="replace")
-            raise RuntimeError(f"HTTP {e.code} on {method} {path}: {body_text}") from e
+            reused = conn.sock is not None
+            try:
+                conn.request(method, self._prefix + path, body=data, headers=self._headers)
+            except (ConnectionResetError, BrokenPipeError):
+                if not reused:
+                    raise
+                # The idle keep-alive socket was already dead, so the server
+                # never got this request — safe to resend on a fresh one.
+                conn.close()
+                conn.request(method, self._prefix + path, body=data, headers=self._headers)
+            resp = conn.getresponse()
+            if keep_body or resp.status >= 400:
+                raw = resp.read()
+            else:
+                _drain(resp)
+                raw = b""
+        except (http_client.HTTPException, OSError) as e:
+            conn.close()  # never leave a half-used connection behind
+            raise RuntimeError(f"{method} {path} failed: {e!r}") from e
+        if resp.status >= 400:
+            _raise_http_error(method, path, resp.status, raw)
+        return resp.status, raw
+
+
+class AsyncClient:
+    """Awaitable front-end for Client.
+
+    http.client is blocking, so each request runs on a worker thread (which
+    keeps its own keep-alive connection); callers gate how many are in flight
+    with an asyncio.Semaphore.
+    """
+
+    def __init__(self, base_url: str, concurrency: int = USER_WORKERS):
+        self.base_url  = base_url.rstrip("/")
+        self._executor = ThreadPoolExecutor(max_workers=concurrency)
+        self._clients: dict[Optional[str], Client] = {}  # one Client per token
+
+    async def post(self, path: str, body: dict, token: Optional[str] = None) -> dict:
+        return await self._call(token, Client.post, path, body)
+
+    async def post_status(self, path: str, body: dict, token: Optional[str] = None) -> int:
+        return await self._call(token, Client.post_status, path, body)
+
+    async def _call(self, token: Optional[str], method: Any, *args: Any) -> Any:
+        client = self._clients.get(token)
+        if client is None:
+            client = self._clients[token] = Client(self.base_url, token)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, method, client, *args)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "AsyncClient":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+async def _read_response_status(reader: asyncio.StreamReader) -> tuple[int, bool]:
+    """Consume one HTTP/1.1 response. Returns (status, server_will_close)."""
+    head    = (await reader.readuntil(b"\r\n\r\n")).decode("latin-1").split("\r\n")
+    _, code, *_ = head[0].split(" ", 2)  # ValueError on a malformed status line
+    status  = int(code)
+    headers = {k.strip().lower(): v.strip().lower()
+               for k, _, v in (line.partition(":") for line in head[1:] if line)}
+    if headers.get("transfer-encoding") == "chunked":
+        while True:
+            size = int((await reader.readline()).split(b";", 1)[0], 16)
+            await reader.readexactly(size + 2)  # chunk data + CRLF (final CRLF when size == 0)
+            if size == 0:
+                break
+    else:
+        await reader.readexactly(int(headers.get("content-length", 0)))
+    return status, headers.get("connection") == "close"
+
+
+class _EofOnLossProtocol(asyncio.StreamReaderProtocol):
+    """Ends the read side with EOF, not an exception, when the connection drops.
+
+    The stock protocol hands the reset to the reader, which then refuses to
+    return responses that had already arrived; pipeline_post still counts
+    those before resending what is left.
+    """
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        super().connection_lost(None)
+
+
+async def _open_pipeline(host: str, port: int,
+                         ssl: bool) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    """asyncio.open_connection, but on _EofOnLossProtocol."""
+    loop   = asyncio.get_running_loop()
+    reader = asyncio.StreamReader()
+    transport, protocol = await loop.create_connection(
+        lambda: _EofOnLossProtocol(reader), host, port, ssl=ssl)
+    return reader, asyncio.StreamWriter(transport, protocol, reader, loop)
+
+
+async def pipeline_post(base_url: str, path: str, jobs: list[tuple[str, dict]],
+                        on_status: Callable[[int], None],
+                        connections: int = PIPELINE_CONNS, depth: int = PIPELINE_DEPTH) -> None:
+    """POST each (token, body) in jobs over a few pipelined keep-alive connections.
+
+    Each connection writes up to `depth` requests ahead of the responses it
+    has read (HTTP/1.1 pipelining), so one handshake serves hundreds of
+    requests and the socket never idles waiting for a round trip. Sends are
+    paced to API_RATE; 429s and requests lost to a dropped or stalled
+    connection are resent, up to MAX_ATTEMPTS. Response bodies are discarded; on_status gets
+    each final status code, or 0 for requests that never got a response.
+    """
+    parts   = urlsplit(base_url)
+    port    = parts.port or (443 if parts.scheme == "https" else 80)
+    pending = deque(
+        [f"POST {parts.path.rstrip('/')}{path} HTTP/1.1\r\n"
+         f"Host: {parts.netloc}\r\n"
+         f"Content-Type: application/json\r\n"
+         f"Accept: application/json\r\n"
+         f"Authorization: Bearer {token}\r\n"
+         f"Content-Length: {len(data)}\r\n\r\n".encode("latin-1") + data, 0]  # [request, attempts]
+        for token, data in ((token, _dumps(body)) for token, body in jobs)
+    )
+
+    def retry(job: list, status: int) -> None:
+        job[1] += 1
+        if job[1] < MAX_ATTEMPTS:
+            pending.append(job)
+        else:
+            on_status(status)
+
+    async def worker() -> None:
+        # Connections in a row that got no response at all; past MAX_ATTEMPTS
+        # this worker leaves the queue to the others.
+        failures = 0
+        while pending and failures < MAX_ATTEMPTS:
+            failures += 1
+            try:
+                reader, writer = await asyncio.wait_for(
+                    _open_pipeline(parts.hostname, port, parts.scheme == "https"), HTTP_TIMEOUT)
+            except (asyncio.TimeoutError, OSError):
+                await asyncio.sleep(RETRY_BACKOFF)
+                continue
+            sent: deque[list] = deque()
+            writable = True
+            try:
+                while sent or (pending and writable):
+                    try:
+                        while writable and pending and len(sent) < depth:
+                            sent.append(pending.popleft())
+                            delay = _pacer.reserve()
+                            if delay > 0:
+                                await writer.drain()
+                                await asyncio.sleep(delay)
+                            writer.write(sent[-1][0])
+                        await writer.drain()
+                    except ConnectionError:
+                        # The server hung up mid-write. Keep reading: the
+                        # responses it sent first are still buffered.
+                        writable = False
+                    status, closing = await asyncio.wait_for(
+                        _read_response_status(reader), HTTP_TIMEOUT)
+                    failures = 0
+                    job = sent.popleft()
+                    if status == 429:
+                        _pacer.backoff(RETRY_BACKOFF)
+                        retry(job, status)
+                    else:
+                        on_status(status)
+                    if closing:
+                        # The server ignores anything pipelined after a
+                        # "Connection: close" response — resend it elsewhere.
+                        pending.extendleft(reversed(sent))
+                        sent.clear()
+                        break
+            except (asyncio.IncompleteReadError, asyncio.LimitOverrunError,
+                    asyncio.TimeoutError, OSError, ValueError):
+                # Dropped, stalled or garbled: the unanswered requests may
+                # never have reached the handler, so resend them (a
+                # duplicate booking just comes back 409).
+                for job in sent:
+                    retry(job, 0)
+            finally:
+                writer.close()
+
+    await asyncio.gather(*[worker() for _ in range(connections)])
+    # Only left over if every connection gave up on a dead or silent server
+    for _ in pending:
+        on_status(0)
 
 
 # ─── Model builders ───────────────────────────────────────────────────────────
 
-def make_slot(lot_id: str, floor_id: str, slot_num: int, row: int, col: int) -> dict:
+def batch_uuids(n: int) -> list[str]:
+    """Return n random (version 4) UUID strings drawn from a single os.urandom call.
+
+    uuid.uuid4() costs one getrandom syscall per id; seeding needs thousands.
+    """
+    buf = bytearray(os.urandom(16 * n))
+    # RFC 4122: version nibble 4 in byte 6, variant bits 10xx in byte 8
+    buf[6::16] = bytes((b & 0x0F) | 0x40 for b in buf[6::16])
+    buf[8::16] = bytes((b & 0x3F) | 0x80 for b in buf[8::16])
+    h = buf.hex()
+    return [
+        f"{h[i:i + 8]}-{h[i + 8:i + 12]}-{h[i + 12:i + 16]}-{h[i + 16:i + 20]}-{h[i + 20:i + 32]}"
+        for i in range(0, 32 * n, 32)
+    ]
+
+
+def make_slot(slot_id: str, lot_id: str, floor_id: str, slot_num: int, row: int, col: int,
+              x: float, y: float) -> dict:
     return {
-        "id":              str(uuid.uuid4()),
+        "id":              slot_id,
         "lot_id":          lot_id,
         "floor_id":        floor_id,
         "slot_number":     slot_num,
@@ -129,21 +465,27 @@ def make_slot(lot_id: str, floor_id: str, slot_num: int, row: int, col: int) ->
         "status":          "available",
         "current_booking": None,
         "features":        [],
-        "position":        {"x": float(col) * 3.0, "y": float(row) * 5.5,
+        "position":        {"x": x, "y": y,
                             "width": 2.5, "height": 5.0, "rotation": 0.0},
     }
 
 
 def make_floor(lot_id: str, floor_index: int, slot_count: int) -> dict:
-    floor_id   = str(uuid.uuid4())
+    floor_id, *slot_ids = batch_uuids(slot_count + 1)
     floor_num  = floor_index + 1
     floor_name = FLOOR_NAMES.get(floor_num, f"Ebene {floor_num}")
     cols       = max(5, math.ceil(math.sqrt(slot_count)))
+    rows       = math.ceil(slot_count / cols)
+
+    # Walk the grid row-major and look positions up per row/column, rather
+    # than deriving row, col, x and y from the slot index one slot at a time.
+    xs   = [float(c) * 3.0 for c in range(cols)]
+    ys   = [float(r) * 5.5 for r in range(rows)]
+    grid = itertools.islice(itertools.product(range(rows), range(cols)), slot_count)
 
     slots = [
-        make_slot(lot_id, floor_id, i + 1,
-                  row=i // cols, col=i % cols)
-        for i in range(slot_count)
+        make_slot(slot_id, lot_id, floor_id, n, row=row, col=col, x=xs[col], y=ys[row])
+        for n, (slot_id, (row, col)) in enumerate(zip(slot_ids, grid), start=1)
     ]
 
     return {
@@ -207,16 +549,21 @@ def make_lot(lot_def: dict) -> dict:
     }
 
 
-def generate_plate(used: set) -> str:
-    for _ in range(50):
-        prefix  = random.choice(PLATE_PREFIXES)
-        letters = "".join(random.choice("ABCDEFGHJKLMNPRSTUVWXYZ") for _ in range(2))
-        digits  = random.randint(100, 9999)
-        plate   = f"{prefix}-{letters} {digits}"
-        if plate not in used:
-            used.add(plate)
-            return plate
-    return f"M-XX {random.randint(1000, 9999)}"
+def generate_plates(n: int) -> list[str]:
+    """Return n distinct licence plates.
+
+    Samples n distinct indices from the prefix × letter-pair × number space
+    and decodes them, so uniqueness holds without retries or a seen-set.
+    """
+    pairs   = len(PLATE_LETTERS) ** 2
+    numbers = 10000 - 100  # 100..9999
+    plates  = []
+    for idx in random.sample(range(len(PLATE_PREFIXES) * pairs * numbers), n):
+        idx, number = divmod(idx, numbers)
+        prefix, pair = divmod(idx, pairs)
+        a, b = divmod(pair, len(PLATE_LETTERS))
+        plates.append(f"{PLATE_PREFIXES[prefix]}-{PLATE_LETTERS[a]}{PLATE_LETTERS[b]} {number + 100}")
+    return plates
 
 
 # ─── Seed routines ────────────────────────────────────────────────────────────
@@ -245,148 +592,235 @@ def ensure_admin(client: Client) -> str:
         raise
 
 
-def seed_lots(client: Client) -> list[dict]:
-    """Create 10 parking lots. Returns list of lot metadata with flat slot IDs."""
-    print(f"\n  Seeding {len(LOTS)} parking lots...")
+def build_lots(lot_defs: list[dict]) -> list[dict]:
+    """Build lot payloads, spreading large batches across CPU cores.
+
+    Lot building is pure-Python CPU work with no shared state; below
+    PARALLEL_LOTS the process start-up costs more than it saves.
+    """
+    if len(lot_defs) <= PARALLEL_LOTS:
+        return [make_lot(d) for d in lot_defs]
+    # Reseed each worker so forked processes don't share one random stream.
+    with multiprocessing.Pool(initializer=random.seed) as pool:
+        return pool.map(make_lot, lot_defs)
+
+
+def _lot_entry(client: Client, lot_def: dict, payload: dict, saved: dict) -> dict:
+    """Flatten a lot into {id, name, slot_ids}, preferring the ids the server assigned."""
+    lot_id   = saved.get("id", payload["id"])
+    slot_ids = [s["id"] for floor in saved.get("floors", []) for s in floor.get("slots", [])]
+    if not slot_ids and saved is not payload:
+        # The server generates slots itself and doesn't echo them back
+        try:
+            slot_ids = [s["id"] for s in client.get(f"/api/v1/lots/{lot_id}/slots").get("data") or []]
+        except RuntimeError:
+            pass
+    if not slot_ids:
+        slot_ids = [s["id"] for floor in payload["floors"] for s in floor["slots"]]
+    return {"id": lot_id, "name": lot_def["name"], "slot_ids": slot_ids}
+
+
+def seed_lots(client: Client, lot_defs: list[dict]) -> list[dict]:
+    """Create the given parking lots. Returns list of lot metadata with flat slot IDs."""
+    print(f"\n  Seeding {len(lot_defs)} parking lots...")
     results = []
-    for lot_def in LOTS:
-        lot_payload = make_lot(lot_def)
+    for lot_def, lot_payload in zip(lot_defs, build_lots(lot_defs)):
         try:
             resp = client.post("/api/v1/lots", lot_payload)
-            saved = resp.get("data", lot_payload)
+            saved = resp.get("data") or lot_payload
         except RuntimeError as e:
             print(f"  ⚠ Failed to create lot '{lot_def['name']}': {e}")
             saved = lot_payload  # use locally generated data
 
-        # Flatten slot IDs from all floors for booking generation
-        slot_ids = []
-        for floor in lot_payload["floors"]:
-            slot_ids.extend(s["id"] for s in floor["slots"])
-
-        results.append({
-            "id":       lot_payload["id"],
-            "name":     lot_def["name"],
-            "slot_ids": slot_ids,
-        })
-        print(f"  ✓ {lot_def['name']} ({len(slot_ids)} slots)")
+        entry = _lot_entry(client, lot_def, lot_payload, saved)
+        results.append(entry)
+        print(f"  ✓ {lot_def['name']} ({len(entry['slot_ids'])} slots)")
 
     return results
 
 
-def seed_users(client: Client) -> list[dict]:
-    """Register 198 demo users with vehicles. Returns list of {id, token, plate}."""
-    print("\n  Seeding 198 demo users...")
-    users  = []
-    used_names: set[str] = set()
-    used_plates: set[str] = set()
-
-    for i in range(198):
-        first = random.choice(FIRST_NAMES)
-        last  = random.choice(LAST_NAMES)
-        base  = f"{first.lower()}.{last.lower()}"
-        username = base
-        attempt  = 1
-        while username in used_names:
-            username = f"{base}{attempt}"
-            attempt += 1
-        used_names.add(username)
-
-        plate = generate_plate(used_plates)
-        car   = random.choice(CAR_DATA)
+def _user_identities(n: int) -> list[dict]:
+    """Pre-generate n demo identities (unique username, name, plate, car)."""
+    identities = []
+
+    # One batched draw per attribute instead of several random.choice calls per
+    # user. Names are sampled without replacement from all first × last pairs,
+    # so usernames are unique without a retry loop.
+    draws = zip(
+        generate_plates(n),
+        batch_uuids(n),
+        random.sample(list(itertools.product(FIRST_NAMES, LAST_NAMES)), n),
+        random.choices(CAR_MODELS, k=n),
+        random.choices(COLORS, k=n),
+    )
+    for plate, vehicle_id, (first, last), (make, model), color in draws:
+        username = f"{first.lower()}.{last.lower()}"
+        identities.append({
+            "username":   username,
+            "name":       f"{first} {last}",
+            "plate":      plate,
+            "vehicle_id": vehicle_id,
+            "make":       make,
+            "model":      model,
+            "color":      color,
+        })
 
-        try:
-            resp = client.post("/api/v1/auth/register", {
-                "username": username,
-                "email":    f"{username}@example.de",
-                "password": "Demo2026!X",
-                "name":     f"{first} {last}",
-            })
-            user_token = resp["data"]["tokens"]["access_token"]
-            user_id    = resp["data"]["user"]["id"]
-
-            # Create primary vehicle
-            user_client = Client(BASE_URL, user_token)
-            now = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-            user_client.post("/api/v1/vehicles", {
-                "id":            str(uuid.uuid4()),
-                "user_id":       user_id,
-                "license_plate": plate,
-                "make":          car[0],
-                "model":         random.choice(car[1]),
-                "color":         random.choice(COLORS),
-                "vehicle_type":  "car",
-                "is_default":    True,
-                "created_at":    now,
-            })
+    return identities
 
-            users.append({"id": user_id, "token": user_token, "plate": plate})
 
-        except RuntimeError as e:
-            print(f"  ⚠ User {username} failed: {e}")
-            continue
+async def _register_one(client: AsyncClient, identity: dict, created_at: str) -> Optional[dict]:
+    """Register one user and create their primary vehicle. Returns None on failure."""
+    username = identity["username"]
+    try:
+        resp = await client.post("/api/v1/auth/register", {
+            "username": username,
+            "email":    f"{username}@example.de",
+            "password": "Demo2026!X",
+            "name":     identity["name"],
+        })
+        user_token = resp["data"]["tokens"]["access_token"]
+        user_id    = resp["data"]["user"]["id"]
+
+        # Create primary vehicle (chained so it follows its registration)
+        await client.post_status("/api/v1/vehicles", {
+            "id":            identity["vehicle_id"],
+            "user_id":       user_id,
+            "license_plate": identity["plate"],
+            "make":          identity["make"],
+            "model":         identity["model"],
+            "color":         identity["color"],
+            "vehicle_type":  "car",
+            "is_default":    True,
+            "created_at":    created_at,
+        }, token=user_token)
+    except RuntimeError as e:
+        log.warning("  ⚠ User %s failed: %s", username, e)
+        return None
+
+    return {"id": user_id, "token": user_token, "plate": identity["plate"]}
 
-        if (i + 1) % 20 == 0:
-            print(f"  ✓ {i + 1}/198 users created")
 
+async def seed_users(client: AsyncClient) -> list[dict]:
+    """Register 198 demo users with vehicles. Returns list of {id, token, plate}."""
+    print("\n  Seeding 198 demo users...")
+    # Identities are generated up front so the concurrent workers share no
+    # mutable state.
+    identities = _user_identities(198)
+    created_at = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    sem        = asyncio.Semaphore(USER_WORKERS)
+    done       = 0
+
+    async def register(identity: dict) -> Optional[dict]:
+        nonlocal done
+        async with sem:
+            user = await _register_one(client, identity, created_at)
+        done += 1
+        if done % 20 == 0:
+            log.info("  ✓ %d/198 users processed", done)
+        return user
+
+    results = await asyncio.gather(*[register(identity) for identity in identities])
+    users   = [u for u in results if u is not None]
     print(f"  ✓ {len(users)} users created")
     return users
 
 
-def seed_bookings(lot_data: list[dict], users: list[dict]) -> None:
-    """Create ~3500 bookings over the next 30 days using per-user tokens."""
-    print("\n  Seeding ~3500 bookings (next 30 days)...")
-    now       = datetime.now(timezone.utc)
-    total     = 0
-    errors    = 0
+def build_booking_schedule(lot_data: list[dict], users: list[dict],
+                           now: datetime) -> list[tuple[dict, dict]]:
+    """Plan ~3500 bookings over the next 30 days as (user, payload) pairs.
+
+    Each day's users, lots, start times and durations are drawn in one
+    random.choices call per field rather than one call per booking.
+    """
+    now_hm   = (now.hour, now.minute)
+    schedule = []
 
     for day_offset in range(30):
         day        = now + timedelta(days=day_offset)
         dow        = day.weekday()  # 0=Mon, 6=Sun
         is_weekend = dow >= 5
         target     = random.randint(40, 70) if is_weekend else random.randint(120, 165)
-
-        for _ in range(target):
-            user = random.choice(users)
-            lot  = random.choice(lot_data)
-            slot_id = random.choice(lot["slot_ids"])
-
-            # Booking window
-            if is_weekend:
-                start_hour = random.randint(9, 15)
+        day_prefix = day.strftime("%Y-%m-%dT")
+
+        draws = zip(
+            random.choices(users, k=target),
+            random.choices(lot_data, k=target),
+            random.choices(WEEKEND_HOURS if is_weekend else WEEKDAY_HOURS, k=target),
+            random.choices(START_MINUTES, k=target),
+            random.choices(DURATIONS, k=target),
+        )
+        for user, lot, start_hour, start_min, duration in draws:
+            # Bookings must be in the future (server validates this); only
+            # today's early slots can fall behind `now`.
+            if day_offset == 0 and (start_hour, start_min) <= now_hm:
+                start = now + timedelta(minutes=random.randint(5, 60))
+                start_time = start.strftime("%Y-%m-%dT%H:%M:%SZ")
             else:
-                start_hour = random.choice([7, 7, 8, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17])
+                start_time = f"{day_prefix}{start_hour:02d}:{start_min:02d}:00Z"
 
-            start_min  = random.choice([0, 15, 30, 45])
-            duration   = random.choice([30, 60, 90, 120, 180, 240, 300, 360, 480])
+            schedule.append((user, {
+                "lot_id":          lot["id"],
+                "slot_id":         random.choice(lot["slot_ids"]),
+                "start_time":      start_time,
+                "duration_minutes": duration,
+                "license_plate":   user["plate"],
+                "notes":           None,
+            }))
 
-            start_time = day.replace(hour=start_hour, minute=start_min, second=0, microsecond=0)
-            # Bookings must be in the future (server validates this)
-            if start_time <= now:
-                start_time = now + timedelta(minutes=random.randint(5, 60))
+    return schedule
 
-            user_client = Client(BASE_URL, user["token"])
-            try:
-                user_client.post("/api/v1/bookings", {
-                    "lot_id":          lot["id"],
-                    "slot_id":         slot_id,
-                    "start_time":      start_time.isoformat().replace("+00:00", "Z"),
-                    "duration_minutes": duration,
-                    "license_plate":   user["plate"],
-                    "notes":           None,
-                })
-                total += 1
-            except RuntimeError:
-                errors += 1
-                continue
 
-        if (day_offset + 1) % 5 == 0:
-            print(f"  ✓ Day {day_offset + 1}/30 done — {total} bookings so far ({errors} errors)")
+async def seed_bookings(client: AsyncClient, lot_data: list[dict], users: list[dict]) -> None:
+    """Create ~3500 bookings over the next 30 days using per-user tokens."""
+    print("\n  Seeding ~3500 bookings (next 30 days)...")
+    # Build the whole schedule up front, then fire it off concurrently.
+    payloads = build_booking_schedule(lot_data, users, datetime.now(timezone.utc))
 
+    total     = 0
+    errors    = 0
+    throttled = 0
+    lost      = 0
+
+    def on_status(status: int) -> None:
+        nonlocal total, errors, throttled, lost
+        if 200 <= status < 300:
+            total += 1
+        elif status == 429:
+            throttled += 1
+        elif status == 0:
+            lost += 1
+        else:
+            errors += 1
+        done = total + errors + throttled + lost
+        if done % 500 == 0:
+            log.info("  ✓ %d/%d processed — %d bookings so far (%d errors)", done, len(payloads), total, errors)
+
+    jobs = [(user["token"], payload) for user, payload in payloads]
+    await pipeline_post(client.base_url, "/api/v1/bookings", jobs, on_status)
     print(f"  ✓ {total} bookings created ({errors} slot conflicts / errors skipped)")
+    if throttled or lost:
+        print(f"  ⚠ {throttled} rate-limited and {lost} unanswered after {MAX_ATTEMPTS} attempts")
 
 
 # ─── Entry point ──────────────────────────────────────────────────────────────
 
+def start_progress_log() -> logging.handlers.QueueListener:
+    """Route progress logging to stderr through a background thread.
+
+    Callers only enqueue records, so per-item progress never blocks on the
+    stream lock or a flush while requests are in flight.
+    """
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    log.addHandler(logging.handlers.QueueHandler(records))
+    log.setLevel(logging.INFO)
+    log.propagate = False
+    listener = logging.handlers.QueueListener(records, handler)
+    listener.start()
+    return listener
+
+
 def main():
     global BASE_URL, ADMIN_PASSWORD
 
@@ -394,37 +828,50 @@ def main():
     parser.add_argument("--base-url",        default=BASE_URL,       help="API base URL")
     parser.add_argument("--admin-password",  default=ADMIN_PASSWORD, help="Admin password")
     parser.add_argument("--dry-run",         action="store_true",    help="Build payloads but don't call API")
+    parser.add_argument("--lot-factor",      type=int, default=1,    help="Repeat the lot set N times (load testing)")
+    parser.add_argument("--rate",            type=float, default=API_RATE,
+                        help="Max API requests per second (0 = unpaced)")
     args = parser.parse_args()
 
     BASE_URL       = args.base_url
     # Prefer env var for password (avoids /proc exposure), fall back to CLI arg
     ADMIN_PASSWORD = os.environ.get("PARKHUB_ADMIN_PASSWORD", args.admin_password)
+    _pacer.set_rate(args.rate)
+
+    lot_defs = LOTS if args.lot_factor <= 1 else [
+        {**d, "name": f"{d['name']} #{k + 1}"} for k in range(args.lot_factor) for d in LOTS
+    ]
 
     if args.dry_run:
-        print("DRY RUN — building one lot payload and printing:")
-        print(json.dumps(make_lot(LOTS[0]), indent=2)[:2000])
+        print(f"DRY RUN — building {len(lot_defs)} lot payloads and printing the first:")
+        print(json.dumps(build_lots(lot_defs)[0], indent=2)[:2000])
         return
 
     print("🏁 ParkHub Rust — Production Demo Seeder")
     print(f"   Target: {BASE_URL}")
 
-    client = Client(BASE_URL)
-
-    # 1. Admin login
-    admin_token = ensure_admin(client)
-    admin_client = Client(BASE_URL, admin_token)
-
-    # 2. Lots
-    lot_data = seed_lots(admin_client)
-
-    # 3. Users + vehicles
-    users = seed_users(client)  # registers use public endpoint
-    if not users:
-        print("❌ No users created — aborting booking seeding")
-        sys.exit(1)
-
-    # 4. Bookings
-    seed_bookings(lot_data, users)
+    progress = start_progress_log()
+    try:
+        client = Client(BASE_URL)
+
+        # 1. Admin login
+        admin_token = ensure_admin(client)
+        admin_client = Client(BASE_URL, admin_token)
+
+        # 2. Lots
+        lot_data = seed_lots(admin_client, lot_defs)
+
+        with AsyncClient(BASE_URL) as async_client:
+            # 3. Users + vehicles
+            users = asyncio.run(seed_users(async_client))  # registers use public endpoint
+            if not users:
+                print("❌ No users created — aborting booking seeding")
+                sys.exit(1)
+
+            # 4. Bookings
+            asyncio.run(seed_bookings(async_client, lot_data, users))
+    finally:
+        progress.stop()  # flushes queued progress lines
 
     print("\n✅ Seed complete!")
     print(f"   Parking lots : {len(lot_data)}")